@@ -13,3 +13,4 @@ DEFAULT_STORE_DAYS = 60
 BASE_URL = "https://zalgiris.lt"
 STORAGE_KEY = "zalgiris_matches_state"
 STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60  # seconds
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import functools
+import hashlib
 import html as html_lib
-import json
 import logging
 import re
+import zlib
 from datetime import timedelta
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
@@ -28,6 +32,7 @@ from .const import (
     DEFAULT_TEAM_PATH,
     DOMAIN,
     STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
     STORAGE_VERSION,
 )
 
@@ -42,19 +47,36 @@ UUID_ANY_RE = re.compile(
     re.IGNORECASE,
 )
 
-# e.g. "PN, 01-30, 21:30" (Lithuanian weekday abbreviations)
-START_RE = re.compile(r"([A-Z]{1,3})\s*,\s*(\d{2})-(\d{2})\s*,\s*(\d{2}):(\d{2})")
-
-KOOBIN_RE = re.compile(r"https?://zalgiris\.koobin\.com[^\s\"<>]+", re.IGNORECASE)
-
-# HTML and escaped-JSON variants
-IMG_SRC_ALT_RE1 = re.compile(r"<img[^>]+src=\"([^\"]+)\"[^>]+alt=\"([^\"]+)\"", re.IGNORECASE)
-IMG_SRC_ALT_RE2 = re.compile(r"<img[^>]+alt=\"([^\"]+)\"[^>]+src=\"([^\"]+)\"", re.IGNORECASE)
-IMG_ESC_RE = re.compile(r"\\\"src\\\":\\\"([^\\\"]+)\\\"[^}]+?\\\"alt\\\":\\\"([^\\\"]+)\\\"", re.IGNORECASE)
+# e.g. "PN, 01-30, 21:30" (Lithuanian weekday abbreviations); the weekday is optional
+# since it sometimes has a weird nbsp char before it (like "\xa0T")
+START_RE = re.compile(r"(?:[A-Z]{1,3}\s*,\s*|\b)(\d{2})-(\d{2})\s*,\s*(\d{2}):(\d{2})")
+
+# Ticket links are emitted by the site itself (always lowercase), so no IGNORECASE
+KOOBIN_RE = re.compile(r"https?://zalgiris\.koobin\.com[^\s\"<>]+")
+
+# HTML (src before alt / alt before src) and escaped-JSON variants, scanned in one pass,
+# plus any other alt attribute (HTML / escaped JSON) for cards where image tags alone
+# don't give two teams. Case-sensitive: the page's markup and JSON keys are lowercase.
+# [^<>] keeps an <img> match inside one tag, so an unclosed tag cannot make the attribute
+# runs backtrack across the rest of the card.
+IMG_COMBINED_RE = re.compile(
+    r"<img[^<>]+src=\"(?P<src1>[^\"]+)\"[^<>]+alt=\"(?P<alt1>[^\"]+)\""
+    r"|<img[^<>]+alt=\"(?P<alt2>[^\"]+)\"[^<>]+src=\"(?P<src2>[^\"]+)\""
+    r"|\\\"src\\\":\\\"(?P<src3>[^\\\"]+)\\\"[^}]+?\\\"alt\\\":\\\"(?P<alt3>[^\\\"]+)\\\""
+    r"|alt=\"(?P<alt_html>[^\"]{2,50})\""
+    r"|\\\"alt\\\":\\\"(?P<alt_esc>[^\\\"]{2,50})\\\""
+)
 
-SCORE_RE = re.compile(r"tabular-nums[^>]*>\s*([^<]{1,3})\s*</p>", re.IGNORECASE)
-SCORE_ESC_RE = re.compile(r"tabular-nums\\\",\\\"children\\\":\\\"([^\\\"]{1,3})", re.IGNORECASE)
+# Any markup tag; stripped from browser-saved page sources (see _normalize_html_for_parsing)
+TAG_RE = re.compile(r"<[^>]+>")
 
+# HTML score cell | escaped-JSON score cell; exactly one of the two groups is set per match
+SCORE_COMBINED_RE = re.compile(
+    r"tabular-nums[^>]*>\s*([^<]{1,3})\s*</p>"
+    r"|tabular-nums\\\",\\\"children\\\":\\\"([^\\\"]{1,3})",
+    re.IGNORECASE,
+)
+
 TV_HTML_RE = re.compile(r"Transliacijos\s*</p>\s*<p[^>]*>([^<]{1,60})</p>", re.IGNORECASE)
 TV_ESC_RE = re.compile(r"Transliacijos\\\",\\\"children\\\":\\\"([^\\\"]{1,60})", re.IGNORECASE)
 LEAGUE_HTML_RE = re.compile(
@@ -66,6 +88,16 @@ LEAGUE_ESC_RE = re.compile(
     re.IGNORECASE,
 )
 
+# First small header line of a card (HTML), last-resort league label
+LEAGUE_HEADER_RE = re.compile(r'text-white/60 text-2xs truncate[^>]*>([^<]{3,60})</p>')
+
+# Opening markup of one match card (HTML and escaped-JSON forms), see _window_bounds
+CARD_BLOCK_MARKERS = (
+    'class="relative flex flex-col bg-gray-700 rounded lg:hidden"',
+    'className":"relative flex flex-col bg-gray-700 rounded lg:hidden"',
+)
+CARD_BLOCK_RE = re.compile("|".join(re.escape(marker) for marker in CARD_BLOCK_MARKERS))
+
 # Common league names seen on the page (we pick the first match)
 KNOWN_LEAGUES = [
     "Eurolyga",
@@ -92,61 +124,97 @@ def _guess_start_dt(month: int, day: int, hour: int, minute: int) -> dt_util.dt.
     return dt
 
 
-def _first_match(pattern: re.Pattern[str], text: str) -> Optional[str]:
-    m = pattern.search(text)
+def _first_match(pattern: re.Pattern[str], text: str, pos: int, endpos: int) -> Optional[str]:
+    m = pattern.search(text, pos, endpos)
     if not m:
         return None
     return m.group(1).strip()
 
 
-def _safe_unescape(s: str) -> str:
-    # Unescape common HTML entities used in attributes
+@functools.lru_cache(maxsize=256)
+def _compiled_info_href(gid: str) -> Tuple[re.Pattern[str], re.Pattern[str]]:
+    # (HTML href, escaped-JSON href) pointing at this game's page
+    esc = re.escape(gid)
     return (
-        s.replace("&amp;", "&")
-        .replace("&quot;", '"')
-        .replace("&#x2F;", "/")
-        .replace("&#47;", "/")
+        re.compile(r'href=\"([^\"]*/rungtynes/%s[^\"]*)\"' % esc),
+        re.compile(r'\\\"href\\\":\\\"([^\\\"]*/rungtynes/%s[^\\\"]*)\\\"' % esc),
     )
 
+
+# Common HTML entities used in attributes (see _safe_unescape)
+_UNESCAPE_MAP = {"&amp;": "&", "&quot;": '"', "&#x2F;": "/", "&#47;": "/"}
+_UNESCAPE_RE = re.compile("|".join(re.escape(k) for k in _UNESCAPE_MAP))
+
+
+def _safe_unescape(s: str) -> str:
+    # Unescape common HTML entities used in attributes, in a single pass.
+    # Deliberately not html.unescape(): it also decodes legacy entities without ";"
+    # (e.g. "&copy=" in a query string), which would corrupt URLs.
+    if "&" not in s:
+        return s
+    return _UNESCAPE_RE.sub(lambda m: _UNESCAPE_MAP[m.group(0)], s)
+
 def _normalize_html_for_parsing(html: str) -> str:
     """Normalize browser-saved page-source wrapper to plain parseable text."""
-    if "saved from url=" not in html or "class=\"line-content\"" not in html:
+    # The "saved from url=" comment sits at the very top of a saved page; only look there so
+    # regular pages are not scanned end to end.
+    if html.find("saved from url=", 0, 4096) < 0 or "class=\"line-content\"" not in html:
         return html
 
     # Browser save can wrap every source token into <span> blocks with escaped entities.
     # Strip the wrapper markup and unescape entities so regex parsing works on real source text.
-    compact = re.sub(r"<[^>]+>", "", html)
+    compact = TAG_RE.sub("", html)
     return html_lib.unescape(compact)
 
 
 
-def _parse_teams_and_logos(window: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+# The _parse_* helpers below take (text, pos, endpos) and only look at text[pos:endpos],
+# so a match card is never copied out of the page.
+
+
+def _parse_teams_and_logos(
+    text: str, pos: int, endpos: int
+) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
     # Build (team -> logo) map with several patterns (HTML + escaped JSON)
     logos: Dict[str, str] = {}
+    # Ordered team lists by first occurrence (dicts keep insertion order): image alts,
+    # then bare HTML / escaped-JSON alts as a fallback
+    ordered: Dict[str, None] = {}
+    alt_html: Dict[str, None] = {}
+    alt_esc: Dict[str, None] = {}
+
+    for m in IMG_COMBINED_RE.finditer(text, pos, endpos):
+        gd = m.groupdict()
+        if gd["src1"] is not None:
+            src, alt = gd["src1"], gd["alt1"]
+        elif gd["src2"] is not None:
+            src, alt = gd["src2"], gd["alt2"]
+        elif gd["src3"] is not None:
+            src, alt = gd["src3"], gd["alt3"]
+        else:
+            t = (gd["alt_html"] or gd["alt_esc"]).strip()
+            if t and t.lower() not in {"žalgiris team"}:
+                (alt_html if gd["alt_html"] is not None else alt_esc).setdefault(t)
+            continue
+        t = alt.strip()
+        logos.setdefault(t, src.strip())
+        if 2 <= len(alt) <= 50 and t and t.lower() not in {"žalgiris team"}:
+            ordered.setdefault(t)
+            # The first two image teams (and their logos) settle the result
+            if len(ordered) >= 2:
+                break
 
-    for src, alt in IMG_SRC_ALT_RE1.findall(window):
-        logos.setdefault(alt.strip(), src.strip())
-    for alt, src in IMG_SRC_ALT_RE2.findall(window):
-        logos.setdefault(alt.strip(), src.strip())
-    for src, alt in IMG_ESC_RE.findall(window):
-        logos.setdefault(alt.strip(), src.strip())
-
-    # Ordered team list by first occurrence of alt="..."
-    teams: List[str] = []
-    # HTML alts
-    for m in re.finditer(r'alt=\"([^\"]{2,50})\"', window):
-        t = m.group(1).strip()
-        if t and t not in teams and t.lower() not in {"žalgiris team"}:
-            teams.append(t)
-        if len(teams) >= 4:
-            break
-    # Escaped JSON alts
+    teams: List[str] = list(ordered)
+
+    # Fewer than two image alts: fall back to the generic alts, HTML ones first
     if len(teams) < 2:
-        for m in re.finditer(r'\\\"alt\\\":\\\"([^\\\"]{2,50})\\\"', window):
-            t = m.group(1).strip()
-            if t and t not in teams and t.lower() not in {"žalgiris team"}:
-                teams.append(t)
-            if len(teams) >= 4:
+        for fallback in (alt_html, alt_esc):
+            for t in fallback:
+                if t not in teams:
+                    teams.append(t)
+                if len(teams) >= 4:
+                    break
+            if len(teams) >= 2:
                 break
 
     # Keep only two main teams (usually includes Žalgiris + opponent)
@@ -162,16 +230,14 @@ def _parse_teams_and_logos(window: str) -> Tuple[Optional[str], Optional[str], O
     return team1, team2, home_logo, away_logo
 
 
-def _parse_scores(window: str) -> Tuple[Optional[int], Optional[int]]:
-    raw: List[str] = []
-    raw.extend([x.strip() for x in SCORE_RE.findall(window)])
-    raw.extend([x.strip() for x in SCORE_ESC_RE.findall(window)])
+def _parse_scores(text: str, pos: int, endpos: int) -> Tuple[Optional[int], Optional[int]]:
+    raw: List[str] = [
+        (html_score or esc_score).strip()
+        for html_score, esc_score in SCORE_COMBINED_RE.findall(text, pos, endpos)
+    ]
 
     # Deduplicate while keeping order
-    cleaned: List[str] = []
-    for r in raw:
-        if r not in cleaned:
-            cleaned.append(r)
+    cleaned: List[str] = list(dict.fromkeys(raw))
 
     nums: List[int] = []
     for r in cleaned:
@@ -186,10 +252,10 @@ def _parse_scores(window: str) -> Tuple[Optional[int], Optional[int]]:
     return None, None
 
 
-def _parse_league(window: str) -> Optional[str]:
-    m = LEAGUE_HTML_RE.search(window)
+def _parse_league(text: str, pos: int, endpos: int) -> Optional[str]:
+    m = LEAGUE_HTML_RE.search(text, pos, endpos)
     if not m:
-        m = LEAGUE_ESC_RE.search(window)
+        m = LEAGUE_ESC_RE.search(text, pos, endpos)
     if m:
         raw = m.group(1).strip()
         low = raw.lower()
@@ -205,58 +271,83 @@ def _parse_league(window: str) -> Optional[str]:
             return "Eurolyga"
         return raw
 
-    window_l = window.lower()
+    window_l = text[pos:endpos].lower()
     for lg in KNOWN_LEAGUES:
         if lg.lower() in window_l:
             return lg
     # Fallback: first small header line (HTML)
-    m = re.search(r'text-white/60 text-2xs truncate[^>]*>([^<]{3,60})</p>', window)
+    m = LEAGUE_HEADER_RE.search(text, pos, endpos)
     if m:
         return m.group(1).strip()
     # Escaped JSON fallback is risky -> keep None
     return None
 
 
-def _parse_start(window: str) -> Optional[dt_util.dt.datetime]:
-    m = START_RE.search(window)
+_ASCII_DIGITS = frozenset("0123456789")
+
+
+def _two_digit(s: str, i: int) -> int:
+    return (ord(s[i]) - 48) * 10 + (ord(s[i + 1]) - 48)
+
+
+def _fast_start_fields(text: str, pos: int, endpos: int) -> Optional[Tuple[int, int, int, int]]:
+    # Happy path for the canonical "PN, 01-30, 21:30" shape: anchor on ", " after the
+    # weekday and read the four 2-digit fields at fixed offsets (MM-DD, HH:MM).
+    n = min(endpos, len(text))
+    i = text.find(", ", pos, n)
+    while i >= 0:
+        j = i + 2
+        if (
+            i > pos
+            and "A" <= text[i - 1] <= "Z"
+            and j + 12 <= n
+            and text[j + 2] == "-"
+            and text[j + 5 : j + 7] == ", "
+            and text[j + 9] == ":"
+            and all(text[k] in _ASCII_DIGITS for k in (j, j + 1, j + 3, j + 4, j + 7, j + 8, j + 10, j + 11))
+        ):
+            return _two_digit(text, j), _two_digit(text, j + 3), _two_digit(text, j + 7), _two_digit(text, j + 10)
+        i = text.find(", ", j, n)
+    return None
+
+
+def _parse_start(text: str, pos: int, endpos: int) -> Optional[dt_util.dt.datetime]:
+    fields = _fast_start_fields(text, pos, endpos)
+    if fields:
+        return _guess_start_dt(*fields)
+
+    # One scan covers both the weekday and the bare "MM-DD, HH:MM" forms
+    m = START_RE.search(text, pos, endpos)
     if not m:
-        # Sometimes weekday has weird nbsp char before it (like "\xa0T")
-        m2 = re.search(r"\b(\d{2})-(\d{2})\s*,\s*(\d{2}):(\d{2})\b", window)
-        if not m2:
-            return None
-        month, day, hh, mm = map(int, m2.groups())
-        return _guess_start_dt(month, day, hh, mm)
-
-    month = int(m.group(2))
-    day = int(m.group(3))
-    hh = int(m.group(4))
-    mm = int(m.group(5))
+        return None
+    month, day, hh, mm = map(int, m.groups())
     return _guess_start_dt(month, day, hh, mm)
 
 
-def _parse_tv(window: str) -> Optional[str]:
-    tv = _first_match(TV_HTML_RE, window)
+def _parse_tv(text: str, pos: int, endpos: int) -> Optional[str]:
+    tv = _first_match(TV_HTML_RE, text, pos, endpos)
     if tv:
         return tv
-    tv = _first_match(TV_ESC_RE, window)
+    tv = _first_match(TV_ESC_RE, text, pos, endpos)
     return tv
 
 
-def _parse_info_url(game_id: str, window: str) -> str:
+def _parse_info_url(game_id: str, text: str, pos: int, endpos: int) -> str:
     # Prefer an explicit href that includes extra params (like ?tab=media) if present.
     # We take the first href around the window that contains this game_id.
-    m = re.search(r'href=\"([^\"]*/rungtynes/%s[^\"]*)\"' % re.escape(game_id), window)
+    html_href_re, esc_href_re = _compiled_info_href(game_id)
+    m = html_href_re.search(text, pos, endpos)
     if m:
         return urljoin(BASE_URL, _safe_unescape(m.group(1)))
-    m = re.search(r'\\\"href\\\":\\\"([^\\\"]*/rungtynes/%s[^\\\"]*)\\\"' % re.escape(game_id), window)
+    m = esc_href_re.search(text, pos, endpos)
     if m:
         return urljoin(BASE_URL, _safe_unescape(m.group(1)))
     return urljoin(BASE_URL, f"/rungtynes/{game_id}")
 
 
-def _parse_tickets_url(window: str) -> Optional[str]:
+def _parse_tickets_url(text: str, pos: int, endpos: int) -> Optional[str]:
     # Pick the first koobin link in this match window
-    m = KOOBIN_RE.search(window)
+    m = KOOBIN_RE.search(text, pos, endpos)
     if not m:
         return None
     return _safe_unescape(m.group(0))
@@ -268,19 +359,56 @@ def _serialize_dt(dt: Optional[dt_util.dt.datetime]) -> Optional[str]:
     return dt.isoformat()
 
 
+def _game_start_dt(g: Dict[str, Any]) -> Optional[dt_util.dt.datetime]:
+    # Parsed "start", cached on the game dict under "_start_dt" (runtime only, never saved)
+    if "_start_dt" not in g:
+        start_iso = g.get("start")
+        g["_start_dt"] = dt_util.parse_datetime(start_iso) if isinstance(start_iso, str) else None
+    return g["_start_dt"]
+
+
+def _log_detail_failures(results: List[Any]) -> None:
+    # One failing detail page must not cancel or hide the others
+    for res in results:
+        if isinstance(res, Exception):
+            _LOGGER.debug("Match details update failed: %s", res)
+
+
+def _public_game(g: Dict[str, Any]) -> Dict[str, Any]:
+    # Drop runtime-only "_" keys before a game is stored or exposed to sensors
+    return {k: v for k, v in g.items() if not k.startswith("_")}
+
+
 class ZalgirisMatchesCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.hass = hass
         self.entry = entry
+        # HA's shared, long-lived session: pooled keep-alive connections across updates
         self.session = async_get_clientsession(hass)
 
         self._etag: Dict[str, str] = {}
         self._last_modified: Dict[str, str] = {}
-        self._last_text: Dict[str, str] = {}
+        # Last body per URL for 304 reuse, zlib-compressed (see _cached_text)
+        self._last_text: Dict[str, bytes] = {}
+        # Fingerprint of the last body received per URL; keys the schedule re-parse check
+        self._body_hash: Dict[str, bytes] = {}
+
+        # (url, body fingerprint) of the last parsed schedule page and its debug info
+        self._parsed_schedule: Optional[Tuple[str, bytes]] = None
+        self._last_debug: Dict[str, Any] = {}
 
         self._games: Dict[str, Dict[str, Any]] = {}  # by game_id
+        # Per-field indexes over self._games (see _index_game), read by _classify and pruning
+        # _starts holds epoch seconds so per-tick comparisons are plain float compares
+        self._starts: Dict[str, Optional[float]] = {}
+        self._scores: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+        # (start_ts, game_id) for every game with a start, kept sorted so _classify and
+        # pruning bisect it instead of sorting every tick
+        self._by_start: List[Tuple[float, str]] = []
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self._store_loaded = False
+        # Set whenever self._games changes; _save_store skips scheduling a write otherwise
+        self._dirty = False
 
         super().__init__(
             hass,
@@ -318,29 +446,54 @@ class ZalgirisMatchesCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             for gid, g in games.items():
                 if isinstance(g, dict):
                     self._games[gid] = g
+                    self._index_game(gid)
+
+    def _index_game(self, gid: str) -> None:
+        # Refresh the _starts/_scores/_by_start entries after self._games[gid] changed
+        g = self._games[gid]
+        start_dt = _game_start_dt(g)
+        start_ts = start_dt.timestamp() if start_dt else None
+        old_ts = self._starts.get(gid)
+        if old_ts != start_ts:
+            if old_ts:
+                del self._by_start[bisect.bisect_left(self._by_start, (old_ts, gid))]
+            if start_ts:
+                bisect.insort(self._by_start, (start_ts, gid))
+        self._starts[gid] = start_ts
+        self._scores[gid] = (g.get("score_home"), g.get("score_away"))
+
+    def _store_data(self) -> Dict[str, Any]:
+        # Called by the Store when the delayed write fires, so it sees the latest games
+        return {
+            "saved_at": _serialize_dt(_now()),
+            "games": {gid: _public_game(g) for gid, g in self._games.items()},
+        }
 
-    async def _save_store(self) -> None:
+    def _save_store(self) -> None:
         # Prune old items by store_days
         days = self._opt_store_days()
-        cutoff = _now() - timedelta(days=days)
+        cutoff_ts = (_now() - timedelta(days=days)).timestamp()
+
+        n_expired = bisect.bisect_left(self._by_start, cutoff_ts, key=itemgetter(0))
+        expired = [gid for _, gid in self._by_start[:n_expired]]
+        del self._by_start[:n_expired]
+        for gid in expired:
+            del self._games[gid]
+            del self._starts[gid]
+            del self._scores[gid]
+        if expired:
+            self._dirty = True
+        if not self._dirty:
+            return
+        self._dirty = False
+        # Debounced: writes within the delay coalesce, and HA flushes pending ones on shutdown
+        self._store.async_delay_save(self._store_data, STORAGE_SAVE_DELAY)
 
-        pruned: Dict[str, Dict[str, Any]] = {}
-        for gid, g in self._games.items():
-            start_iso = g.get("start")
-            start_dt = dt_util.parse_datetime(start_iso) if isinstance(start_iso, str) else None
-            if start_dt and start_dt < cutoff:
-                continue
-            pruned[gid] = g
-
-        self._games = pruned
-        await self._store.async_save(
-            {
-                "saved_at": _serialize_dt(_now()),
-                "games": self._games,
-            }
-        )
+    def _cached_text(self, url: str) -> str:
+        return zlib.decompress(self._last_text[url]).decode("utf-8")
 
-    async def _fetch_text(self, url: str) -> str:
+    async def _fetch_text(self, url: str, max_bytes: Optional[int] = None) -> str:
+        """With max_bytes set only the first max_bytes of the body are read and decoded."""
         headers = {"User-Agent": "HomeAssistant-ZalgirisMatches/2.0"}
         if url in self._etag:
             headers["If-None-Match"] = self._etag[url]
@@ -349,11 +502,43 @@ class ZalgirisMatchesCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
 
         try:
             async with async_timeout.timeout(15):
-                resp = await self.session.get(url, headers=headers, allow_redirects=True)
+                resp = None
+                if max_bytes is not None and url in self._etag and url in self._last_text:
+                    # Match pages: probe one byte first, since a server that ignores If-None-Match
+                    # still reports its ETag on a ranged reply
+                    probe = await self.session.get(
+                        url, headers={**headers, "Range": "bytes=0-0"}, allow_redirects=True
+                    )
+                    if probe.status == 304 or (
+                        probe.status in (200, 206) and probe.headers.get("ETag") == self._etag[url]
+                    ):
+                        probe.release()
+                        return self._cached_text(url)
+                    if probe.status == 200:
+                        # Range ignored and the page changed: this already is the full response
+                        resp = probe
+                    else:
+                        probe.release()
+                if resp is None:
+                    resp = await self.session.get(url, headers=headers, allow_redirects=True)
                 if resp.status == 304 and url in self._last_text:
-                    return self._last_text[url]
+                    return self._cached_text(url)
                 resp.raise_for_status()
-                text = await resp.text()
+                if max_bytes is None:
+                    body = await resp.read()
+                    # text() decodes the body read above, it is not downloaded twice
+                    text = await resp.text()
+                else:
+                    buf = bytearray()
+                    async for chunk in resp.content.iter_chunked(8192):
+                        buf.extend(chunk)
+                        if len(buf) >= max_bytes:
+                            break
+                    resp.release()
+                    # Slice through a memoryview so the cut body is copied once, not twice
+                    body = bytes(memoryview(buf)[:max_bytes])
+                    # The cut may split a multi-byte character; drop it rather than fail
+                    text = body.decode(resp.charset or "utf-8", errors="ignore")
 
                 etag = resp.headers.get("ETag")
                 if etag:
@@ -362,90 +547,80 @@ class ZalgirisMatchesCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 if lm:
                     self._last_modified[url] = lm
 
-                self._last_text[url] = text
+                # Hash the raw body rather than re-encoding the decoded text
+                self._body_hash[url] = hashlib.blake2b(body, digest_size=16).digest()
+
+                self._last_text[url] = zlib.compress(text.encode("utf-8"), 3)
                 return text
         except Exception as err:  # noqa: BLE001
             raise UpdateFailed(f"Fetch failed ({url}): {err}") from err
 
-    def _parse_schedule(self, html: str) -> Tuple[List[str], Dict[str, Any]]:
-        game_ids = []
-        href_ids = UUID_RE.findall(html)
-        for gid in href_ids:
-            if gid not in game_ids:
-                game_ids.append(gid)
+    def _parse_schedule(self, html: str) -> Tuple[List[Tuple[str, int]], Dict[str, Any]]:
+        # One pass over the page: game ids in first-seen order plus the offset of each
+        # game's link anchor (a "?tab=media" link wins over plain ones).
+        matches = list(UUID_RE.finditer(html))
+        anchors: Dict[str, int] = {}
+        media_anchors: Dict[str, int] = {}
+        for m in matches:
+            gid = m.group(1)
+            anchors.setdefault(gid, m.start())
+            if html.startswith("?tab=media", m.end()):
+                media_anchors.setdefault(gid, m.start())
+        anchors.update(media_anchors)
 
         parse_mode = "href"
-        if not game_ids:
+        if not anchors:
             parse_mode = "uuid_fallback"
-            for gid in UUID_ANY_RE.findall(html):
-                if gid not in game_ids:
-                    game_ids.append(gid)
+            for m in UUID_ANY_RE.finditer(html):
+                anchors.setdefault(m.group(1), m.start())
+        games = list(anchors.items())
 
         debug = {
             "parse_mode": parse_mode,
-            "links_found": len(href_ids),
-            "matches_found": len(game_ids),
-            "has_rungtynes": "/rungtynes" in html,
-            "has_uuid": bool(game_ids),
-            "html_head": html[:160].replace("\n", " "),
-        }
-        return game_ids, debug
-
-    def _extract_match_window(self, html: str, game_id: str, size: int = 6000) -> str:
-        # Prefer direct match link anchors; they are the most stable for one-card context.
-        m = re.search(r"/rungtynes/%s\?tab=media" % re.escape(game_id), html, re.IGNORECASE)
-        if not m:
-            m = re.search(r"/rungtynes/%s" % re.escape(game_id), html, re.IGNORECASE)
-        if not m:
-            m = re.search(r"\"%s\"" % re.escape(game_id), html, re.IGNORECASE)
-        idx = m.start() if m else html.find(game_id)
-        if idx < 0:
-            idx = 0
+            "links_found": len(matches),
+            "matches_found": len(games),
+            "has_rungtynes": "/rungtynes" in html,
+            "has_uuid": bool(games),
+            "html_head": html[:160].replace("\n", " "),
+        }
+        return games, debug
 
+    def _window_bounds(self, html: str, idx: int, card_starts: List[int], size: int = 6000) -> Tuple[int, int]:
+        # (start, end) of one game's card in html; idx is its anchor offset from _parse_schedule
+        # and card_starts the sorted offsets of every CARD_BLOCK_RE match in html.
         # Try to isolate exactly one match card block around the anchor.
-        block_markers = [
-            'class="relative flex flex-col bg-gray-700 rounded lg:hidden"',
-            'className":"relative flex flex-col bg-gray-700 rounded lg:hidden"',
-        ]
-        card_start = -1
-        card_end = -1
-        for marker in block_markers:
-            s = html.rfind(marker, 0, idx)
-            if s >= 0 and s > card_start:
-                card_start = s
-        if card_start >= 0:
-            for marker in block_markers:
-                e = html.find(marker, idx + 50)
-                if e >= 0 and (card_end < 0 or e < card_end):
-                    card_end = e
-        if card_start >= 0 and card_end > card_start:
-            span = html[card_start:card_end]
-            if 800 <= len(span) <= 50000:
-                return span
-
-        start = max(0, idx - size // 2)
-        end = min(len(html), idx + size // 2)
-        return html[start:end]
-
-    def _parse_match_from_window(self, game_id: str, window: str) -> Dict[str, Any]:
-        start_dt = _parse_start(window)
-        team1, team2, logo1, logo2 = _parse_teams_and_logos(window)
-        s1, s2 = _parse_scores(window)
+        i = bisect.bisect_left(card_starts, idx)
+        j = bisect.bisect_left(card_starts, idx + 50, i)
+        if i > 0 and j < len(card_starts):
+            card_start = card_starts[i - 1]
+            card_end = card_starts[j]
+            if 800 <= card_end - card_start <= 50000:
+                return card_start, card_end
+
+        start = max(0, idx - size // 2)
+        end = min(len(html), idx + size // 2)
+        return start, end
+
+    def _parse_match_from_window(self, game_id: str, text: str, pos: int, endpos: int) -> Dict[str, Any]:
+        start_dt = _parse_start(text, pos, endpos)
+        team1, team2, logo1, logo2 = _parse_teams_and_logos(text, pos, endpos)
+        s1, s2 = _parse_scores(text, pos, endpos)
 
         return {
             "game_id": game_id,
             "start": _serialize_dt(start_dt),
-            "league": _parse_league(window),
+            "league": _parse_league(text, pos, endpos),
             "home": team1,
             "away": team2,
             "home_logo": logo1,
             "away_logo": logo2,
-            "tv": _parse_tv(window),
+            "tv": _parse_tv(text, pos, endpos),
             "arena": None,  # usually not present in schedule; can be filled from match page later
             "score_home": s1,
             "score_away": s2,
-            "info_url": _parse_info_url(game_id, window),
-            "tickets_url": _parse_tickets_url(window),
+            "info_url": _parse_info_url(game_id, text, pos, endpos),
+            "tickets_url": _parse_tickets_url(text, pos, endpos),
+            "_start_dt": start_dt,
         }
 
     async def _maybe_fetch_match_details(self, game: Dict[str, Any]) -> None:
@@ -454,45 +629,88 @@ class ZalgirisMatchesCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         if not url:
             return
 
-        html = await self._fetch_text(url)
-        # Re-use same parsing rules on the match page
-        window = html[:12000]
+        now = _now()
+        # Details were refreshed moments ago (e.g. a manual refresh right after a scheduled one)
+        last_fetch = game.get("_last_detail_fetch")
+        if last_fetch and (now - last_fetch).total_seconds() < self._opt_scan_interval() * 0.75:
+            return
 
-        # Update only missing / important fields
-        parsed = self._parse_match_from_window(game["game_id"], window)
+        # Only the top of the match page is parsed (see below)
+        html = await self._fetch_text(url, max_bytes=16384)
+        game["_last_detail_fetch"] = now
+        # Re-use same parsing rules on the top of the match page; update only missing / important fields
+        parsed = self._parse_match_from_window(game["game_id"], html, 0, 12000)
 
+        changed = False
         for k in ["home", "away", "home_logo", "away_logo", "tv", "arena", "score_home", "score_away"]:
             if parsed.get(k) is None:
                 continue
-            if game.get(k) in (None, "", "—", "-"):
-                game[k] = parsed[k]
-            # Always refresh scores during live
-            if k in ("score_home", "score_away") and parsed.get(k) is not None:
-                game[k] = parsed[k]
+            # Fill empty fields; always refresh scores during live
+            if game.get(k) in (None, "", "—", "-") or k in ("score_home", "score_away"):
+                if game.get(k) != parsed[k]:
+                    game[k] = parsed[k]
+                    changed = True
+        if changed:
+            self._dirty = True
+            if self._games.get(game["game_id"]) is game:
+                self._index_game(game["game_id"])
 
     def _classify(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-        now = _now()
-        upcoming: List[Dict[str, Any]] = []
+        now_ts = _now().timestamp()
+        # _by_start is sorted: games after the split are upcoming (soonest first)
+        split = bisect.bisect_right(self._by_start, now_ts, key=itemgetter(0))
+        upcoming: List[Dict[str, Any]] = [self._games[gid] for _, gid in self._by_start[split:]]
         finished: List[Dict[str, Any]] = []
 
-        for g in self._games.values():
-            start_iso = g.get("start")
-            start_dt = dt_util.parse_datetime(start_iso) if isinstance(start_iso, str) else None
-            if not start_dt:
-                continue
+        recent_ts = now_ts - 6 * 3600
+        # Past games, most recent first
+        for i in range(split - 1, -1, -1):
+            start_ts, gid = self._by_start[i]
+            score_home, score_away = self._scores[gid]
+            has_score = (score_home is not None) and (score_away is not None)
+            # Past: keep if we have a score (or it was within last 6h so it might still be relevant)
+            if has_score or (start_ts > recent_ts):
+                finished.append(self._games[gid])
 
-            has_score = (g.get("score_home") is not None) and (g.get("score_away") is not None)
+        return upcoming, finished
 
-            if start_dt > now:
-                upcoming.append(g)
-            else:
-                # Past: keep if we have a score (or it was within last 6h so it might still be relevant)
-                if has_score or (start_dt > now - timedelta(hours=6)):
-                    finished.append(g)
+    def _merge_schedule(self, html: str) -> Dict[str, Any]:
+        html = _normalize_html_for_parsing(html)
+        games, debug = self._parse_schedule(html)
+        # Card boundaries are collected once for the whole page
+        card_starts = [m.start() for m in CARD_BLOCK_RE.finditer(html)]
 
-        upcoming.sort(key=lambda x: x.get("start") or "")
-        finished.sort(key=lambda x: x.get("start") or "", reverse=True)
-        return upcoming, finished
+        # Parse schedule matches
+        for gid, idx in games:
+            start, end = self._window_bounds(html, idx, card_starts)
+            parsed = self._parse_match_from_window(gid, html, start, end)
+
+            # Merge into cache in place. None never overwrites, so known scores (schedule
+            # returns "-") and a known arena are kept.
+            game = self._games.get(gid, {})
+            changed = False
+            for k, v in parsed.items():
+                if v is not None and game.get(k) != v:
+                    game[k] = v
+                    changed = True
+
+            if changed:
+                self._games[gid] = game
+                self._index_game(gid)
+                self._dirty = True
+
+        return debug
+
+    def _detail_candidates(self, finished: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Most recent started games (last 24h) whose score is still missing
+        now = _now()
+        candidates = []
+        for g in finished[:3]:
+            start_dt = _game_start_dt(g)
+            if start_dt and start_dt > now - timedelta(hours=24):
+                if g.get("score_home") is None or g.get("score_away") is None:
+                    candidates.append(g)
+        return candidates[:2]
 
     async def _async_update_data(self) -> Dict[str, Any]:
         # Update interval (options can change)
@@ -504,55 +722,47 @@ class ZalgirisMatchesCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
 
         schedule_url = urljoin(BASE_URL, team_path)
 
-        html = await self._fetch_text(schedule_url)
-        html = _normalize_html_for_parsing(html)
-        game_ids, debug = self._parse_schedule(html)
-
-        # Parse schedule matches
-        for gid in game_ids:
-            window = self._extract_match_window(html, gid)
-            parsed = self._parse_match_from_window(gid, window)
-
-            # Merge into cache
-            existing = self._games.get(gid, {})
-            merged = {**existing, **{k: v for k, v in parsed.items() if v is not None}}
-            # Keep scores if we already have them and schedule returns "-"
-            if existing.get("score_home") is not None and parsed.get("score_home") is None:
-                merged["score_home"] = existing["score_home"]
-            if existing.get("score_away") is not None and parsed.get("score_away") is None:
-                merged["score_away"] = existing["score_away"]
-            # Preserve arena if already known
-            if existing.get("arena") and not parsed.get("arena"):
-                merged["arena"] = existing["arena"]
-
-            self._games[gid] = merged
+        # Score backfill for cached games only needs the cache, so it runs alongside
+        # the schedule fetch; the merge below layers the schedule on top of it
+        _, finished = self._classify()
+        early = self._detail_candidates(finished)
+        results = await asyncio.gather(
+            self._fetch_text(schedule_url),
+            *(self._maybe_fetch_match_details(g) for g in early),
+            return_exceptions=True,
+        )
+        html = results[0]
+        if isinstance(html, BaseException):
+            raise html
+        _log_detail_failures(results[1:])
+
+        parsed_key = (schedule_url, self._body_hash[schedule_url])
+        if self._parsed_schedule == parsed_key:
+            # Same page as the last parse: its games are already merged into the cache
+            debug = self._last_debug
+        else:
+            debug = self._merge_schedule(html)
+            self._parsed_schedule = parsed_key
+            self._last_debug = debug
 
         upcoming, finished = self._classify()
 
-        # Try to finalize score for the most recent started games (last 24h) if score is missing
-        detail_tasks = []
-        now = _now()
-        candidates = []
-        for g in finished[:3]:
-            start_dt = dt_util.parse_datetime(g.get("start")) if g.get("start") else None
-            if start_dt and start_dt > now - timedelta(hours=24):
-                if g.get("score_home") is None or g.get("score_away") is None:
-                    candidates.append(g)
-        for g in candidates[:2]:
-            detail_tasks.append(self._maybe_fetch_match_details(g))
-
-        if detail_tasks:
-            try:
-                await asyncio.gather(*detail_tasks)
-            except Exception as err:  # noqa: BLE001
-                _LOGGER.debug("Match details update failed: %s", err)
-
+        # Games the schedule just added (e.g. the first refresh on an empty store) weren't
+        # candidates above; backfill them now rather than a scan interval later
+        early_ids = {g["game_id"] for g in early}
+        late = [g for g in self._detail_candidates(finished) if g["game_id"] not in early_ids]
+        if late:
+            results = await asyncio.gather(
+                *(self._maybe_fetch_match_details(g) for g in late),
+                return_exceptions=True,
+            )
+            _log_detail_failures(results)
             # Re-classify after details update
             upcoming, finished = self._classify()
 
         # Save store occasionally (not every tick)
         try:
-            await self._save_store()
+            self._save_store()
         except Exception as err:  # noqa: BLE001
             _LOGGER.debug("Store save failed: %s", err)
 
@@ -560,7 +770,9 @@ class ZalgirisMatchesCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             "team_path": team_path,
             "source_url": schedule_url,
             "fetched_at": _serialize_dt(_now()),
-            "upcoming": upcoming,
-            "finished": finished,
+            # Already-parsed start of the next game, so the sensor doesn't re-parse the ISO string
+            "next_start": _game_start_dt(upcoming[0]) if upcoming else None,
+            "upcoming": [_public_game(g) for g in upcoming],
+            "finished": [_public_game(g) for g in finished],
             "debug": debug,
         }
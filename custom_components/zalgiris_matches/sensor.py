@@ -8,7 +8,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import ZalgirisMatchesCoordinator
@@ -55,10 +54,7 @@ class ZalgirisSensor(CoordinatorEntity[ZalgirisMatchesCoordinator], SensorEntity
             return len(data.get("upcoming") or []) + len(data.get("finished") or [])
 
         if self.desc.key == "next":
-            upcoming = data.get("upcoming") or []
-            if not upcoming:
-                return None
-            return dt_util.parse_datetime(upcoming[0].get("start"))
+            return data.get("next_start")
 
         return None
 